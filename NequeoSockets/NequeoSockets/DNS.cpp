@@ -134,7 +134,12 @@ Nequeo::Net::Sockets::IPAddress Nequeo::Net::Sockets::DNS::resolveOne(const std:
 {
 	NetworkInitializer networkInitializer;
 
-	const HostEntry& entry = resolve(address);
+	// A literal address needs no lookup.
+	IPAddress ip;
+	if (IPAddress::tryParse(address, ip))
+		return ip;
+
+	const HostEntry& entry = hostByName(address);
 	if (!entry.addresses().empty())
 		return entry.addresses()[0];
 	else
@@ -92,6 +92,9 @@ namespace Nequeo {
 				static IPAddress resolveOne(const std::string& address);
 				/// Convenience method that calls resolve(address) and returns 
 				/// the first address from the HostInfo.
+				///
+				/// If address is already an IP address in presentation format
+				/// it is returned directly without performing a DNS lookup.
 
 				static HostEntry thisHost();
 				/// Returns a HostEntry object containing the DNS information